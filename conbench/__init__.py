@@ -110,23 +110,28 @@ def _init_flask_application(app):
     from .api import api
     from .app import app as blueprint_app
     from .config import Config
-    from .db import configure_engine, create_all, session_maker
+    from .db import configure_engine, create_all, read_session_maker, session_maker
 
     # Note(JP): maybe this bootstrap extension doesn't do too much work for us.
     # We use `quick_form()` here and there, and that is tied to bootstrap 3.
     # Looks like we want to do that UI work 'manually' (it is not a lot of
     # work), and can then remove this extension.
-    from .extensions import bootstrap, login_manager
+    from .extensions import OrjsonLoadsJSONProvider, bootstrap, login_manager
 
     bootstrap.init_app(app)
     login_manager.init_app(app)
 
+    app.json = OrjsonLoadsJSONProvider(app)
+
     api_docs = flask_swagger_ui.get_swaggerui_blueprint(
         "/api/docs",
         "/api/docs.json",
         config={"app_name": Config.APPLICATION_NAME},
     )
-    configure_engine(app.config["SQLALCHEMY_DATABASE_URI"])
+    configure_engine(
+        app.config["SQLALCHEMY_DATABASE_URI"],
+        read_replica_url=app.config["SQLALCHEMY_DATABASE_URI_READ_REPLICA"],
+    )
 
     # This is a tiny helper that manages a per-request SQLAlchemy session which
     # can be obtained via `current_session` (from flask_sqlalchemy_session
@@ -137,6 +142,9 @@ def _init_flask_application(app):
     # for each HTTP request.
     # https://docs.sqlalchemy.org/en/20/orm/contextual.html#using-thread-local-scope-with-web-applications
     flask_scoped_session(session_maker, app)
+    if app.config["SQLALCHEMY_DATABASE_URI_READ_REPLICA"]:
+        # Exposed via `current_read_session`.
+        flask_scoped_session(read_session_maker, app, app_attr="read_scoped_session")
 
     # Do not create all tables when running alembic migrations in
     # production (CREATE_ALL_TABLES=false) using k8s migration job
@@ -1,6 +1,10 @@
+import threading
+from typing import Optional
+
 import apispec
 import apispec.ext.marshmallow
 import apispec_webframeworks.flask
+import orjson
 
 from ..api import _examples as ex
 from ..config import Config
@@ -15,18 +19,6 @@ if Config.INTENDED_BASE_URL is not None:
     api_server_url = Config.INTENDED_BASE_URL
 
 
-spec = apispec.APISpec(
-    title=Config.APPLICATION_NAME,
-    version="1.0.0",
-    openapi_version="3.0.2",
-    plugins=[
-        apispec_webframeworks.flask.FlaskPlugin(),
-        apispec.ext.marshmallow.MarshmallowPlugin(),
-    ],
-    servers=[{"url": api_server_url}],
-)
-
-
 example2 = {
     "code": 400,
     "description": {"extra": ["Unknown field."]},
@@ -34,77 +26,73 @@ example2 = {
 }
 
 
-def _error(error, example, schema=None):
+def _json_content(example, schema=None) -> dict:
     content = {"example": example}
     if schema:
-        content = {"schema": schema, "example": example}
-    return {"description": error, "content": {"application/json": content}}
+        content["schema"] = schema
+    return {"application/json": content}
+
+
+def _error(error, example, schema=None):
+    return {"description": error, "content": _json_content(example, schema)}
 
 
 def _200_ok(example, schema=None):
-    content = {"example": example}
-    if schema:
-        content = {"schema": schema, "example": example}
-    return {"description": "OK", "content": {"application/json": content}}
+    return {"description": "OK", "content": _json_content(example, schema)}
 
 
 def _201_created(example, schema=None):
-    content = {"example": example}
-    if schema:
-        content = {"schema": schema, "example": example}
     return {
         "description": "Created \n\n The resulting entity URL is returned in the Location header.",
-        "content": {"application/json": content},
+        "content": _json_content(example, schema),
         #         "headers": {
         #             "Location": {"description": "The new entity URL.", "type": "url"}
         #         },
     }
 
 
-spec.components.response("200", {"description": "OK"})
-spec.components.response("201", {"description": "Created"})
-spec.components.response("202", {"description": "No Content (accepted)"})
-spec.components.response("204", {"description": "No Content (success)"})
-spec.components.response("302", {"description": "Found"})
-spec.components.response("400", _error("Bad Request", ex.API_400, "ErrorBadRequest"))
-spec.components.response("401", _error("Unauthorized", ex.API_401, "Error"))
-spec.components.response("404", _error("Not Found", ex.API_404, "Error"))
-spec.components.response("Ping", _200_ok(ex.API_PING, "Ping"))
-spec.components.response("Index", _200_ok(ex.API_INDEX))
-spec.components.response("BenchmarkEntity", _200_ok(ex.BENCHMARK_ENTITY))
-spec.components.response(
-    "BenchmarkList",
-    _200_ok({"data": [ex.BENCHMARK_ENTITY], "metadata": {"next_page_cursor": None}}),
+# (response name, example, schema name) for all "200 OK" responses.
+_200_OK_RESPONSES = (
+    ("Ping", ex.API_PING, "Ping"),
+    ("Index", ex.API_INDEX, None),
+    ("BenchmarkEntity", ex.BENCHMARK_ENTITY, None),
+    (
+        "BenchmarkList",
+        {"data": [ex.BENCHMARK_ENTITY], "metadata": {"next_page_cursor": None}},
+        None,
+    ),
+    ("CommitEntity", ex.COMMIT_ENTITY, None),
+    ("CommitList", [ex.COMMIT_ENTITY], None),
+    ("CompareEntity", ex.COMPARE_ENTITY, None),
+    ("CompareList", ex.COMPARE_LIST, None),
+    ("ContextEntity", ex.CONTEXT_ENTITY, None),
+    ("ContextList", [ex.CONTEXT_ENTITY], None),
+    ("InfoList", [ex.INFO_ENTITY], None),
+    (
+        "HistoryList",
+        {"data": [ex.HISTORY_ENTITY], "metadata": {"next_page_cursor": None}},
+        None,
+    ),
+    ("InfoEntity", ex.INFO_ENTITY, None),
+    ("HardwareEntity", ex.HARDWARE_ENTITY, None),
+    ("HardwareList", [ex.HARDWARE_ENTITY], None),
+    ("RunEntityWithBaselines", ex.RUN_ENTITY_WITH_BASELINES, None),
+    ("RunEntityWithoutBaselines", ex.RUN_ENTITY_WITHOUT_BASELINES, None),
+    (
+        "RunList",
+        {"data": ex.RUN_LIST, "metadata": {"next_page_cursor": None}},
+        None,
+    ),
+    ("UserEntity", ex.USER_ENTITY, None),
+    ("UserList", ex.USER_LIST, None),
 )
-spec.components.response("BenchmarkResultCreated", _201_created(ex.BENCHMARK_ENTITY))
-spec.components.response("CommitEntity", _200_ok(ex.COMMIT_ENTITY))
-spec.components.response("CommitList", _200_ok([ex.COMMIT_ENTITY]))
-spec.components.response("CompareEntity", _200_ok(ex.COMPARE_ENTITY))
-spec.components.response("CompareList", _200_ok(ex.COMPARE_LIST))
-spec.components.response("ContextEntity", _200_ok(ex.CONTEXT_ENTITY))
-spec.components.response("ContextList", _200_ok([ex.CONTEXT_ENTITY]))
-spec.components.response("InfoList", _200_ok([ex.INFO_ENTITY]))
-spec.components.response(
-    "HistoryList",
-    _200_ok({"data": [ex.HISTORY_ENTITY], "metadata": {"next_page_cursor": None}}),
-)
-spec.components.response("InfoEntity", _200_ok(ex.INFO_ENTITY))
-spec.components.response("HardwareEntity", _200_ok(ex.HARDWARE_ENTITY))
-spec.components.response("HardwareList", _200_ok([ex.HARDWARE_ENTITY]))
-spec.components.response(
-    "RunEntityWithBaselines", _200_ok(ex.RUN_ENTITY_WITH_BASELINES)
-)
-spec.components.response(
-    "RunEntityWithoutBaselines", _200_ok(ex.RUN_ENTITY_WITHOUT_BASELINES)
-)
-spec.components.response(
-    "RunList", _200_ok({"data": ex.RUN_LIST, "metadata": {"next_page_cursor": None}})
-)
-spec.components.response("RunCreated", _201_created({}))
-spec.components.response("UserEntity", _200_ok(ex.USER_ENTITY))
-spec.components.response("UserList", _200_ok(ex.USER_LIST))
-spec.components.response("UserCreated", _201_created(ex.USER_ENTITY))
 
+# (response name, example) for all "201 Created" responses.
+_201_CREATED_RESPONSES = (
+    ("BenchmarkResultCreated", ex.BENCHMARK_ENTITY),
+    ("RunCreated", {}),
+    ("UserCreated", ex.USER_ENTITY),
+)
 
 tags = [
     {"name": "Authentication"},
@@ -122,5 +110,95 @@ tags = [
 ]
 
 
+spec = apispec.APISpec(
+    title=Config.APPLICATION_NAME,
+    version="1.0.0",
+    openapi_version="3.0.2",
+    plugins=[
+        apispec_webframeworks.flask.FlaskPlugin(),
+        apispec.ext.marshmallow.MarshmallowPlugin(),
+    ],
+    servers=[{"url": api_server_url}],
+)
+
+spec.components.response("200", {"description": "OK"})
+spec.components.response("201", {"description": "Created"})
+spec.components.response("202", {"description": "No Content (accepted)"})
+spec.components.response("204", {"description": "No Content (success)"})
+spec.components.response("302", {"description": "Found"})
+spec.components.response("400", _error("Bad Request", ex.API_400, "ErrorBadRequest"))
+spec.components.response("401", _error("Unauthorized", ex.API_401, "Error"))
+spec.components.response("404", _error("Not Found", ex.API_404, "Error"))
+
+for _name, _example, _schema in _200_OK_RESPONSES:
+    spec.components.response(_name, _200_ok(_example, _schema))
+
+for _name, _example in _201_CREATED_RESPONSES:
+    spec.components.response(_name, _201_created(_example))
+
 for tag in tags:
     spec.tag(tag)
+
+
+# The serialized OpenAPI document, built upon first call to `spec_json()`.
+# Note(JP): the `spec` object is being passed around and populated from a
+# variety of places during module import time (and during app construction,
+# see `_init_api_docs()`). Therefore it's advisable to not inspect/analyze it
+# during import time because it might not be complete yet. Build it lazily,
+# once, and then serve the same byte sequence for all subsequent requests.
+_spec_json: Optional[bytes] = None
+_spec_json_lock = threading.Lock()
+
+
+def _finalize_spec() -> dict:
+    # The following uses a strategy for displaying object model schema in
+    # Redoc. See  https://github.com/conbench/conbench/pull/826 for a
+    # discussion. The current solution is modeled after
+    # https://github.com/Topsort/openapi/pull/32.
+    # The disadvantage is that this also shows up in the Swagger UI.
+    mdchunks = []
+    # Module import order is not stable and therefore the key sorting in this
+    # dictionary may be different for each application startup. Sort keys
+    # alphabetically to get a stable outcome.
+    for schemaname in sorted(spec.components.schemas.keys()):
+        mdchunks.append(
+            f"## {schemaname}\n"
+            f'<SchemaDefinition schemaRef="#/components/schemas/{schemaname}" />\n'
+        )
+
+    spec.tag(
+        {
+            "name": "Models",
+            "x-displayName": "Object models",
+            "description": "\n".join(mdchunks),
+        }
+    )
+
+    d = spec.to_dict()
+
+    # In TESTING mode there is a special endpoint that gets
+    # automatically added to the spec. Cleanly remove it
+    # here (never emit it as part of the API spec) so that
+    # we do not need to bother with complicating approaches
+    # in test_docs.
+    if "/api/wipe-db" in d["paths"]:
+        del d["paths"]["/api/wipe-db"]
+        del d["paths"]["/api/raise-httperr"]
+        del d["paths"]["/api/raise-unexpected"]
+
+    return d
+
+
+def spec_json() -> bytes:
+    """
+    Return the OpenAPI document as JSON byte sequence. Built only once per
+    process (the expensive part is `spec.to_dict()`, walking all registered
+    components, paths and tags).
+    """
+    global _spec_json
+
+    with _spec_json_lock:
+        if _spec_json is None:
+            _spec_json = orjson.dumps(_finalize_spec(), option=orjson.OPT_SORT_KEYS)
+
+    return _spec_json
@@ -24,8 +24,7 @@ def resp429(description: str) -> flask.Response:
 
 
 def json_response_for_byte_sequence(data: bytes, status_code: int) -> flask.Response:
-    # Note(JP): it's documented that a byte sequence can be passed in:
-    # https://flask.palletsprojects.com/en/2.2.x/api/#flask.Flask.make_response
-    return flask.make_response(
-        (data, status_code, {"content-type": "application/json"})
-    )
+    # Construct the response object directly instead of going through
+    # `make_response()`'s return value normalization (tuple unpacking, header
+    # merging). For a byte sequence, Content-Length is set automatically.
+    return flask.Response(data, status=status_code, mimetype="application/json")
@@ -1,24 +1,28 @@
-import collections
+import itertools
 import logging
 import math
 import threading
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
 import flask as f
+import numpy as np
+import orjson
 import sqlalchemy as s
+from sqlalchemy.orm import lazyload, selectinload
 
 import conbench.units
 from conbench.dbsession import current_session
-from conbench.numstr import numstr
 from conbench.types import THistFingerprint
 
 from ..api import rule
 from ..api._endpoint import ApiEndpoint, maybe_login_required
-from ..api._resp import resp429
+from ..api._resp import json_response_for_byte_sequence, resp429
+from ..config import Config
 from ..entities.benchmark_result import BenchmarkResult
 from ..entities.history import set_z_scores
-from ..hacks import set_display_benchmark_name, set_display_case_permutation
+from ..hacks import bulk_annotate
+from ..numstr import numstr
 
 log = logging.getLogger(__name__)
 
@@ -29,12 +33,15 @@ DEFAULT_Z_SCORE_THRESHOLD = 5.0
 # Context: https://github.com/voltrondata-labs/arrow-benchmarks-ci/issues/124
 # The compare endpoint can be rather resource-heavy. This here is a pragmatic
 # QoS solution / DoS protection: only ever have one of the request-handling
-# threads work on an /api/compare/... request.
+# threads work on an /api/compare/... request (unless configured otherwise via
+# CONBENCH_API_COMPARE_MAX_CONCURRENCY).
 # Under a lot of API pressure this helps keep the system going. In that case,
 # however, individual requests may be responded to after a longer waiting time.
 # In those contexts, it makes sense to apply large HTTP request timeout
 # constants.
-_semaphore_compare_get = threading.BoundedSemaphore(1)
+_semaphore_compare_get = threading.BoundedSemaphore(
+    max(1, Config.API_COMPARE_MAX_CONCURRENCY)
+)
 
 
 @contextmanager
@@ -73,19 +80,22 @@ def _parse_two_ids_or_abort(compare_ids: str) -> Tuple[str, str]:
     return baseline_id, contender_id
 
 
-def _get_threshold_args_from_request() -> Tuple[Optional[float], Optional[float]]:
+def _get_threshold_args_from_request() -> Tuple[float, float]:
     """Attempt to read query parameters from the request context.
 
-    Returns a tuple of (threshold, threshold_z), where each value is either
-    a float or None.
+    Returns a tuple of (threshold, threshold_z). Each value is either the
+    user-given value, or the default. Done once per request, the result is
+    shared across all comparators.
     """
-    threshold = f.request.args.get("threshold")
-    if threshold is not None:
-        threshold = float(threshold)
+    threshold = DEFAULT_PAIRWISE_PERCENT_THRESHOLD
+    threshold_arg = f.request.args.get("threshold")
+    if threshold_arg is not None:
+        threshold = float(threshold_arg)
 
-    threshold_z = f.request.args.get("threshold_z")
-    if threshold_z is not None:
-        threshold_z = float(threshold_z)
+    threshold_z = DEFAULT_Z_SCORE_THRESHOLD
+    threshold_z_arg = f.request.args.get("threshold_z")
+    if threshold_z_arg is not None:
+        threshold_z = float(threshold_z_arg)
 
     return threshold, threshold_z
 
@@ -100,8 +110,27 @@ def _round(value: float) -> Optional[float]:
     interpolation. For the UI we should really do
     https://github.com/conbench/conbench/issues/1334 though.
 
+    Note: for non-NaN input this is equivalent to
+    `float(numstr(value, sigfigs=4))`, but avoids the float -> str -> float
+    round trip (this is called a couple of times per comparison, i.e. many
+    thousand times when comparing two large runs).
     """
-    return None if math.isnan(value) else float(numstr(value, sigfigs=4))
+    # NaN check without function call: NaN is the only float not equal to
+    # itself.
+    if value != value:
+        return None
+
+    if value == 0 or math.isinf(value):
+        return float(value)
+
+    # Number of decimal places to keep for 4 significant figures; negative
+    # for values >= 10**4, rounding to tens, hundreds, etc.
+    try:
+        return round(value, 3 - math.floor(math.log10(abs(value))))
+    except OverflowError:
+        # Rounding up close to the largest representable float. Leave this
+        # rare edge case to numstr() (which results in +/- inf here).
+        return float(numstr(value, sigfigs=4))
 
 
 if TYPE_CHECKING:
@@ -111,16 +140,20 @@ if TYPE_CHECKING:
         augmented in-place with the following augmentation functions, as is done in this
         module:
 
-        - set_z_scores()
-        - set_display_benchmark_name()
-        - set_display_case_permutation()
+        - bulk_annotate() (or set_display_benchmark_name() and
+          set_display_case_permutation())
 
         TODO: remove this and replace with actual BenchmarkResult properties.
         """
 
         display_bmname: str
         display_case_perm: str
-        z_score: Optional[float]
+
+
+# The "analysis" object for comparisons where numeric comparison is not
+# possible (one side is missing or failed). Shared across comparators (never
+# mutated, only serialized).
+_NULL_ANALYSIS: dict = {"pairwise": None, "lookback_z_score": None}
 
 
 class UnmatchingUnitsError(Exception):
@@ -130,12 +163,23 @@ class UnmatchingUnitsError(Exception):
 class BenchmarkResultComparator:
     """Data model class to hold the comparison of two BenchmarkResults."""
 
+    # Many thousand instances may be created when comparing two large runs.
+    __slots__ = (
+        "unit",
+        "less_is_better",
+        "do_comparison",
+        "baseline",
+        "contender",
+        "threshold",
+        "threshold_z",
+    )
+
     def __init__(
         self,
         baseline: Optional["AugmentedBenchmarkResult"],
         contender: Optional["AugmentedBenchmarkResult"],
-        threshold: Optional[float],
-        threshold_z: Optional[float],
+        threshold: float,
+        threshold_z: float,
     ) -> None:
         # What do we know here? Is one of baseline and contender guaranteed
         # to not be None?
@@ -179,32 +223,28 @@ class BenchmarkResultComparator:
             assert baseline.unitsymbol
             self.unit = baseline.unitsymbol
 
+        # This is only defined when this comparison has a unit.
+        self.less_is_better: Optional[bool] = (
+            None if self.unit is None else conbench.units.less_is_better(self.unit)
+        )
+
         # Signal to the mathy methods if all conditions are met for performing
         # numeric comparison.
         self.do_comparison = do_comparison
 
         self.baseline = baseline
         self.contender = contender
-        self.threshold = (
-            float(threshold)
-            if threshold is not None
-            else DEFAULT_PAIRWISE_PERCENT_THRESHOLD
-        )
-        self.threshold_z = (
-            float(threshold_z) if threshold_z is not None else DEFAULT_Z_SCORE_THRESHOLD
-        )
+        self.threshold = threshold
+        self.threshold_z = threshold_z
 
-    @property
-    def less_is_better(self) -> Optional[bool]:
+    @staticmethod
+    def result_info(
+        result: Optional["AugmentedBenchmarkResult"], svs: Optional[float]
+    ) -> Optional[dict]:
         """
-        This is only defined when this comparison has a unit.
+        `svs`: the single value summary of `result`, passed in because it is
+        computed upon each access of `result.svs` (access it only once).
         """
-        if self.unit is None:
-            return None
-        return conbench.units.less_is_better(self.unit)
-
-    @staticmethod
-    def result_info(result: Optional["AugmentedBenchmarkResult"]) -> Optional[dict]:
         if not result:
             return None
 
@@ -212,10 +252,9 @@ class BenchmarkResultComparator:
             "benchmark_result_id": result.id,
             "benchmark_name": result.display_bmname,
             "case_permutation": result.display_case_perm,
-            "language": result.context.tags.get("benchmark_language", "unknown"),
-            "single_value_summary": None
-            if math.isnan(result.svs)
-            else _round(result.svs),
+            "language": result.context.benchmark_language,
+            # _round() maps NaN to None.
+            "single_value_summary": None if svs is None else _round(svs),
             "error": result.error,
             "batch_id": result.batch_id,
             "run_id": result.run_id,
@@ -223,78 +262,136 @@ class BenchmarkResultComparator:
         }
 
     @property
-    def pairwise_analysis(self) -> Optional[dict]:
-        if not self.do_comparison:
-            return None
+    def _dict_for_api_json(self) -> dict:
+        return next(_dicts_for_api_json([self]))
 
-        assert self.baseline
-        assert self.contender
 
-        if self.baseline.svs == 0:
-            # Don't divide by zero.
-            # On the other hand maybe we should not have results
-            # reporting zero of anything:
-            # https://github.com/conbench/conbench/issues/532
-            return None
+def _dicts_for_api_json(
+    comparators: List[BenchmarkResultComparator],
+) -> Iterator[dict]:
+    """
+    Yield the API JSON representation (dict) of each comparator, in order.
+    Generator so that the consumer can process (serialize) one dict at a time.
 
-        relative_change = (self.contender.svs - self.baseline.svs) / abs(
-            self.baseline.svs
+    Perform the numeric part of the pairwise and lookback z-score analyses
+    with NumPy, vectorized across all comparators. When comparing two large
+    runs that saves many thousand scalar Python float operations.
+    """
+    # Single value summary of baseline and contender for each comparator
+    # (None for a missing result). `svs` is computed upon each access, access
+    # it only once.
+    svs_pairs = [
+        (
+            c.baseline.svs if c.baseline else None,
+            c.contender.svs if c.contender else None,
+        )
+        for c in comparators
+    ]
+
+    # The analyses are only defined for comparators that meet the conditions
+    # for numeric comparison.
+    todo = [i for i, c in enumerate(comparators) if c.do_comparison]
+
+    # Collect the inputs of the analyses, one row per comparator.
+    rows: List[Tuple[float, float, float, bool, float, float]] = []
+    for i in todo:
+        c = comparators[i]
+        assert c.contender
+        z_score = c.contender.z_score
+        baseline_svs, contender_svs = svs_pairs[i]
+        rows.append(
+            (
+                baseline_svs,
+                contender_svs,
+                # NaN and None are treated equivalently below.
+                math.nan if z_score is None else z_score,
+                bool(c.less_is_better),
+                c.threshold,
+                c.threshold_z,
+            )
         )
-        if self.less_is_better:
-            relative_change = relative_change * -1
-
-        percent_change = relative_change * 100.0
-        regression_indicated = -percent_change > self.threshold
-        improvement_indicated = percent_change > self.threshold
-
-        percent_change_for_output = _round(relative_change * 100.0)
-        return {
-            "percent_change": percent_change_for_output,
-            "percent_threshold": self.threshold,
-            "regression_indicated": regression_indicated,
-            "improvement_indicated": improvement_indicated,
-        }
-
-    @property
-    def lookback_z_score_analysis(self) -> Optional[dict]:
-        if not self.do_comparison:
-            return None
-
-        assert self.baseline
-        assert self.contender
-
-        if self.contender.z_score is None or math.isnan(self.contender.z_score):
-            return None
-
-        regression_indicated = -self.contender.z_score > self.threshold_z
-        improvement_indicated = self.contender.z_score > self.threshold_z
 
-        return {
-            "z_threshold": self.threshold_z,
-            "z_score": _round(self.contender.z_score),
-            "regression_indicated": regression_indicated,
-            "improvement_indicated": improvement_indicated,
+    # Columns of shape (n,). The reshape() makes this also work for n=0.
+    cols = np.array(rows, dtype=np.float64).reshape(len(rows), 6).T
+    baseline_svs, contender_svs, z_scores = cols[0], cols[1], cols[2]
+    less_is_better = cols[3].astype(np.bool_)
+    thresholds, thresholds_z = cols[4], cols[5]
+
+    # The result for baseline_svs == 0 is discarded below (don't divide by
+    # zero), silence the corresponding warnings.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative_change = (contender_svs - baseline_svs) / np.abs(baseline_svs)
+    relative_change = np.where(less_is_better, relative_change * -1, relative_change)
+    percent_change = relative_change * 100.0
+
+    # Convert to lists of native Python types (float, bool) for serialization.
+    baseline_svs_list = baseline_svs.tolist()
+    pct_list = percent_change.tolist()
+    pct_regression_list = (-percent_change > thresholds).tolist()
+    pct_improvement_list = (percent_change > thresholds).tolist()
+    z_list = z_scores.tolist()
+    z_regression_list = (-z_scores > thresholds_z).tolist()
+    z_improvement_list = (z_scores > thresholds_z).tolist()
+
+    analysis_by_index: Dict[int, dict] = {}
+    for row, i in enumerate(todo):
+        c = comparators[i]
+        pairwise = None
+        # Don't divide by zero. On the other hand maybe we should not have
+        # results reporting zero of anything:
+        # https://github.com/conbench/conbench/issues/532
+        if baseline_svs_list[row] != 0:
+            pairwise = {
+                "percent_change": _round(pct_list[row]),
+                "percent_threshold": c.threshold,
+                "regression_indicated": pct_regression_list[row],
+                "improvement_indicated": pct_improvement_list[row],
+            }
+
+        # Watch out: this can be dict or None, and both needs to be handled
+        # in the UI (for now).
+        lookback_z_score = None
+        if z_list[row] == z_list[row]:  # not NaN
+            lookback_z_score = {
+                "z_threshold": c.threshold_z,
+                "z_score": _round(z_list[row]),
+                "regression_indicated": z_regression_list[row],
+                "improvement_indicated": z_improvement_list[row],
+            }
+
+        analysis_by_index[i] = {
+            "pairwise": pairwise,
+            "lookback_z_score": lookback_z_score,
         }
 
-    @property
-    def _dict_for_api_json(self) -> dict:
-        return {
+    result_info = BenchmarkResultComparator.result_info
+    for i, c in enumerate(comparators):
+        baseline_svs_i, contender_svs_i = svs_pairs[i]
+        yield {
             # How is 'unit' here specified? Let's specify it: If both results
             # are not failed and have the same unit then this here is the unit
             # symbol. Else it's null/None.
-            "unit": self.unit,
-            "less_is_better": self.less_is_better,
-            "baseline": self.result_info(self.baseline),
-            "contender": self.result_info(self.contender),
-            "analysis": {
-                "pairwise": self.pairwise_analysis,
-                # Watch out: self.lookback_z_score_analysis can be dict or
-                # None, and both needs to be handled in the UI (for now).
-                "lookback_z_score": self.lookback_z_score_analysis,
-            },
+            "unit": c.unit,
+            # Plain slot attribute, computed once in __init__.
+            "less_is_better": c.less_is_better,
+            "baseline": result_info(c.baseline, baseline_svs_i),
+            "contender": result_info(c.contender, contender_svs_i),
+            "analysis": analysis_by_index.get(i, _NULL_ANALYSIS),
         }
 
 
+def _group_by_fingerprint(
+    results: List[BenchmarkResult],
+) -> Dict[THistFingerprint, List[BenchmarkResult]]:
+    """Group benchmark results by history fingerprint, retaining order."""
+    groups: Dict[THistFingerprint, List[BenchmarkResult]] = {}
+    for result in results:
+        # The fingerprint is a plain string (cheap to hash), stored on the
+        # result as column value.
+        groups.setdefault(result.history_fingerprint, []).append(result)
+    return groups
+
+
 class CompareBenchmarkResultsAPI(ApiEndpoint):
     @staticmethod
     def _get_a_result(benchmark_result_id: str) -> BenchmarkResult:
@@ -392,17 +489,13 @@ class CompareBenchmarkResultsAPI(ApiEndpoint):
                 contender_benchmark_results=[contender_result],
                 baseline_commit=baseline_commit,
             )
-        else:
-            # If the baseline run is not associated with a commit, skip z-scores. The
-            # ["analysis"]["lookback_z_score"] dict will then be null in the response.
-            contender_result.z_score = None
+        # Else: if the baseline run is not associated with a commit, skip z-scores
+        # (`z_score` is None by default). The ["analysis"]["lookback_z_score"] dict
+        # will then be null in the response.
 
         # TODO: define dynamic properties on BenchmarkResult instead of mutating these
         # objects here in-place.
-        set_display_case_permutation(baseline_result)
-        set_display_case_permutation(contender_result)
-        set_display_benchmark_name(baseline_result)
-        set_display_benchmark_name(contender_result)
+        bulk_annotate((baseline_result, contender_result))
 
         try:
             comparator = BenchmarkResultComparator(
@@ -414,7 +507,9 @@ class CompareBenchmarkResultsAPI(ApiEndpoint):
         except UnmatchingUnitsError as e:
             f.abort(400, description=str(e))
 
-        return f.jsonify(comparator._dict_for_api_json)
+        return json_response_for_byte_sequence(
+            orjson.dumps(comparator._dict_for_api_json), 200
+        )
 
 
 # from filprofiler.api import profile as filprofile
@@ -422,22 +517,47 @@ class CompareBenchmarkResultsAPI(ApiEndpoint):
 
 class CompareRunsAPI(ApiEndpoint):
     @staticmethod
-    def _get_all_results_for_a_run(run_id: str) -> List[BenchmarkResult]:
-        """Get all benchmark results for a run. Abort if the run doesn't exist or if
-        there are no results for the run.
+    def _get_all_results_for_two_runs(
+        baseline_run_id: str, contender_run_id: str
+    ) -> Tuple[List[BenchmarkResult], List[BenchmarkResult]]:
+        """Get all benchmark results for the baseline run and for the contender
+        run, using a single query. Abort if either run doesn't exist or if there
+        are no results for it.
         """
-        # TODO: fairly slow; e.g. 3 seconds for 3500 results. Maybe we select only the
-        # columns we need. Today it's joining to case, context, hardware, and commit
-        result = current_session.scalars(
-            s.select(BenchmarkResult).where(BenchmarkResult.run_id == run_id)
+        # Note: by default, the relationships of BenchmarkResult are all loaded
+        # via JOIN for each row. For thousands of results that is slow (e.g. 3
+        # seconds for 3500 results). Here, `case` and `context` are needed for
+        # each result (display name, tags, language) but are shared by many
+        # results: load each distinct one only once via SELECT ... IN. Hardware
+        # and info are not needed at all. The commit is needed only once (for
+        # the first baseline result), i.e. load it lazily.
+        results = current_session.scalars(
+            s.select(BenchmarkResult)
+            .options(
+                selectinload(BenchmarkResult.case),
+                selectinload(BenchmarkResult.context),
+                lazyload(BenchmarkResult.commit),
+                lazyload(BenchmarkResult.hardware),
+                lazyload(BenchmarkResult.info),
+            )
+            .where(BenchmarkResult.run_id.in_((baseline_run_id, contender_run_id)))
         ).all()
 
-        if not result:
-            f.abort(
-                404, description=f"no benchmark results found for run ID: '{run_id}'"
-            )
+        results_by_run_id: Dict[str, List[BenchmarkResult]] = {
+            baseline_run_id: [],
+            contender_run_id: [],
+        }
+        for result in results:
+            results_by_run_id[result.run_id].append(result)
+
+        for run_id in (baseline_run_id, contender_run_id):
+            if not results_by_run_id[run_id]:
+                f.abort(
+                    404,
+                    description=f"no benchmark results found for run ID: '{run_id}'",
+                )
 
-        return list(result)
+        return results_by_run_id[baseline_run_id], results_by_run_id[contender_run_id]
 
     @staticmethod
     def _join_results(
@@ -452,28 +572,35 @@ class CompareRunsAPI(ApiEndpoint):
 
         If there are multiple results for a history fingerprint in both lists, a
         cartesian product of them all will be returned.
-        """
-        baseline_results_by_fing: Dict[
-            THistFingerprint, List[Optional[BenchmarkResult]]
-        ] = collections.defaultdict(list)
-        contender_results_by_fing: Dict[
-            THistFingerprint, List[Optional[BenchmarkResult]]
-        ] = collections.defaultdict(list)
-
-        for result in baseline_results:
-            baseline_results_by_fing[result.history_fingerprint].append(result)
 
-        for result in contender_results:
-            contender_results_by_fing[result.history_fingerprint].append(result)
+        Pairs of non-failed results where the units differ are not returned
+        (they cannot be compared).
+        """
+        baseline_results_by_fing = _group_by_fingerprint(baseline_results)
+        contender_results_by_fing = _group_by_fingerprint(contender_results)
 
         joined_results: List[
             Tuple[Optional[BenchmarkResult], Optional[BenchmarkResult]]
         ] = []
 
-        for fing in set(baseline_results_by_fing) | set(contender_results_by_fing):
-            for baseline_result in baseline_results_by_fing[fing] or [None]:
-                for contender_result in contender_results_by_fing[fing] or [None]:
-                    joined_results.append((baseline_result, contender_result))
+        for fing in baseline_results_by_fing.keys() | contender_results_by_fing.keys():
+            joined_results.extend(
+                (baseline, contender)
+                for baseline, contender in itertools.product(
+                    baseline_results_by_fing.get(fing) or (None,),
+                    contender_results_by_fing.get(fing) or (None,),
+                )
+                # Filter out unit mismatches here instead of relying on
+                # BenchmarkResultComparator to raise UnmatchingUnitsError
+                # for each of them. Same condition as in the comparator: a
+                # failed result pairs with anything (it may or may not have
+                # a unit, and that unit is not validated).
+                if baseline is None
+                or contender is None
+                or baseline.is_failed
+                or contender.is_failed
+                or baseline.unit == contender.unit
+            )
 
         return joined_results
 
@@ -530,8 +657,9 @@ class CompareRunsAPI(ApiEndpoint):
     def _get(self, compare_ids: str) -> f.Response:
         baseline_run_id, contender_run_id = _parse_two_ids_or_abort(compare_ids)
         threshold, threshold_z = _get_threshold_args_from_request()
-        baseline_results = self._get_all_results_for_a_run(baseline_run_id)
-        contender_results = self._get_all_results_for_a_run(contender_run_id)
+        baseline_results, contender_results = self._get_all_results_for_two_runs(
+            baseline_run_id, contender_run_id
+        )
 
         # All baseline results share a run (and therefore a commit).
         # The baseline_results list is guaranteed to be non-empty.
@@ -542,40 +670,41 @@ class CompareRunsAPI(ApiEndpoint):
                 contender_benchmark_results=contender_results,
                 baseline_commit=baseline_commit,
             )
-        else:
-            # If the baseline run is not associated with a commit, skip z-scores. The
-            # ["analysis"]["lookback_z_score"] dict will then be null in the response.
-            for result in contender_results:
-                result.z_score = None
-
-        for benchmark_result in baseline_results:
-            # TODO: define dynamic properties on BenchmarkResult instead of
-            # mutating these objects here in-place.
-            set_display_benchmark_name(benchmark_result)
-            set_display_case_permutation(benchmark_result)
-
-        for benchmark_result in contender_results:
-            set_display_benchmark_name(benchmark_result)
-            set_display_case_permutation(benchmark_result)
-
-        comparators: List[BenchmarkResultComparator] = []
-        for baseline_result, contender_result in self._join_results(
-            baseline_results, contender_results
-        ):
-            try:
-                comparators.append(
-                    BenchmarkResultComparator(
-                        baseline=baseline_result,
-                        contender=contender_result,
-                        threshold=threshold,
-                        threshold_z=threshold_z,
-                    )
-                )
-            except UnmatchingUnitsError:
-                # Don't return comparisons if their units mismatch.
-                pass
-
-        return f.jsonify([comparator._dict_for_api_json for comparator in comparators])
+        # Else: if the baseline run is not associated with a commit, skip z-scores
+        # (`z_score` is None by default). The ["analysis"]["lookback_z_score"] dict
+        # will then be null in the response.
+
+        # TODO: define dynamic properties on BenchmarkResult instead of
+        # mutating these objects here in-place.
+        bulk_annotate(itertools.chain(baseline_results, contender_results))
+
+        # _join_results() does not emit pairs with mismatching units, i.e.
+        # UnmatchingUnitsError is not expected here.
+        comparators = [
+            BenchmarkResultComparator(
+                baseline=baseline_result,
+                contender=contender_result,
+                threshold=threshold,
+                threshold_z=threshold_z,
+            )
+            for baseline_result, contender_result in self._join_results(
+                baseline_results, contender_results
+            )
+        ]
+
+        # See https://github.com/conbench/conbench/issues/999 -- for large
+        # responses, orjson is significantly faster than the stdlib-based
+        # f.jsonify(). Serialize each comparison object individually and
+        # assemble the JSON array from the fragments, so that the list of all
+        # (rather big) dicts is never materialized. Not using a
+        # streamed response here on purpose: the serialization work should
+        # happen while holding _semaphore_compare_get.
+        jsonbytes = (
+            b"["
+            + b",".join(orjson.dumps(d) for d in _dicts_for_api_json(comparators))
+            + b"]"
+        )
+        return json_response_for_byte_sequence(jsonbytes, 200)
 
 
 compare_benchmark_results_view = CompareBenchmarkResultsAPI.as_view(
@@ -9,60 +9,20 @@ from sqlalchemy.sql import text
 from conbench.dbsession import current_session
 
 from ..api import api, rule
-from ..api._docs import api_server_url, spec
+from ..api._docs import api_server_url, spec, spec_json
 from ..api._endpoint import ApiEndpoint
 from ..buildinfo import BUILD_INFO
 from ..config import Config
 from ..db import empty_db_tables
+from ._resp import json_response_for_byte_sequence
+from .results import clear_row_json_cache
 
 log = logging.getLogger(__name__)
 
 
 @api.route("/docs.json")
 def docs():
-    # Note(JP): the `spec` object is being passed around and populated from a
-    # variety of places during module import time. Therefore it's advisable to
-    # not inspect/analyze it during import time because it might not be
-    # complete yet. The per-request dynamic construction below is probably fast
-    # enough (if not, we can add a cache that stores the result of the first
-    # request).
-
-    # The following uses a strategy for displaying object model schema in
-    # Redoc. See  https://github.com/conbench/conbench/pull/826 for a
-    # discussion. The current solution is modeled after
-    # https://github.com/Topsort/openapi/pull/32.
-    # The disadvantage is that this also shows up in the Swagger UI.
-    mdchunks = []
-    # Module import order is not stable and therefore the key sorting in this
-    # dictionary may be different for each application startup. Sort keys
-    # alphabetically to get a stable outcome.
-    for schemaname in sorted(spec.components.schemas.keys()):
-        mdchunks.append(
-            f"## {schemaname}\n"
-            f'<SchemaDefinition schemaRef="#/components/schemas/{schemaname}" />\n'
-        )
-
-    spec.tag(
-        {
-            "name": "Models",
-            "x-displayName": "Object models",
-            "description": "\n".join(mdchunks),
-        }
-    )
-
-    d = spec.to_dict()
-
-    # In TESTING mode there is a special endpoint that gets
-    # automatically added to the spec. Cleanly remove it
-    # here (never emit it as part of the API spec) so that
-    # we do not need to bother with complicating approaches
-    # in test_docs.
-    if "/api/wipe-db" in d["paths"]:
-        del d["paths"]["/api/wipe-db"]
-        del d["paths"]["/api/raise-httperr"]
-        del d["paths"]["/api/raise-unexpected"]
-
-    return f.jsonify(d)
+    return json_response_for_byte_sequence(spec_json(), 200)
 
 
 # In addition to serving the Swagger UI at /api/docs, maybe temporarily also
@@ -207,6 +167,7 @@ if Config.TESTING:
     def wipe_db():
         log.info("clear DB tables")
         empty_db_tables()
+        clear_row_json_cache()
         return "200 OK", 200
 
     @api.route("/raise-httperr", methods=("GET",))
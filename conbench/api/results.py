@@ -1,27 +1,81 @@
 import logging
+import os
+from dataclasses import dataclass
+from typing import List, Optional
 
 import flask as f
 import flask_login
 import orjson
 from sqlalchemy import select
+from sqlalchemy.orm import lazyload, selectinload
 
 import conbench.metrics
-from conbench.dbsession import current_session
+from conbench.cachetools import LRUCacheWithTTL
+from conbench.dbsession import (
+    current_read_session,
+    current_session,
+    read_session_is_replica,
+)
 
 from ..api import rule
 from ..api._docs import spec
-from ..api._endpoint import ApiEndpoint, maybe_login_required
-from ..entities._entity import NotFound
+from ..api._endpoint import ApiEndpoint, as_bool, maybe_login_required
+from ..config import Config
 from ..entities.benchmark_result import (
     BenchmarkResult,
     BenchmarkResultFacadeSchema,
-    BenchmarkResultSerializer,
     BenchmarkResultValidationError,
 )
 from ._resp import json_response_for_byte_sequence, resp400
 
 log = logging.getLogger(__name__)
 
+# Marshmallow schema instances used for validating request bodies, resolved
+# once at import time.
+_SCHEMA_CREATE = BenchmarkResultFacadeSchema.create
+_SCHEMA_UPDATE = BenchmarkResultFacadeSchema.update
+
+# Serialized JSON representation of individual benchmark results (as emitted
+# by BenchmarkListAPI.get), keyed by benchmark result ID. Entries are dropped
+# upon PUT/DELETE handled by this process. Other changes are not tracked: a
+# PUT/DELETE handled by another process, and changes to the embedded commit
+# (e.g. commit information backfilled from GitHub after result insertion)
+# and hardware objects. I.e. the list endpoint may serve data that is stale
+# by up to the TTL, while the single-result GET endpoint (not cached) is
+# always fresh.
+#
+# The size of a fragment depends on the number of data points / iteration
+# times in `stats` which is not bounded. Typical fragments are a few kB in
+# size. Do not cache larger ones, so that the memory footprint of this cache
+# is bounded by _ROW_JSON_CACHE_MAXSIZE * _ROW_JSON_CACHE_MAX_ITEM_BYTES
+# (64 MiB).
+_ROW_JSON_CACHE_MAXSIZE = 8192
+_ROW_JSON_CACHE_MAX_ITEM_BYTES = 8192
+_ROW_JSON_CACHE = LRUCacheWithTTL(maxsize=_ROW_JSON_CACHE_MAXSIZE, ttl=60)
+
+
+def clear_row_json_cache() -> None:
+    """Drop all cached serialized benchmark results (e.g. after wiping the
+    database)."""
+    _ROW_JSON_CACHE.clear()
+
+
+def _benchmark_result_json(benchmark_result: BenchmarkResult, use_cache: bool) -> bytes:
+    if not use_cache:
+        return orjson.dumps(benchmark_result.to_dict_for_json_api())
+
+    # The JSON object contains absolute URLs, i.e. depends on the URL root of
+    # the current request.
+    url_root = f.request.url_root
+    cached = _ROW_JSON_CACHE.get(benchmark_result.id)
+    if cached is not None and cached[0] == url_root:
+        return cached[1]
+
+    jsonbytes = orjson.dumps(benchmark_result.to_dict_for_json_api())
+    if len(jsonbytes) <= _ROW_JSON_CACHE_MAX_ITEM_BYTES:
+        _ROW_JSON_CACHE.set(benchmark_result.id, (url_root, jsonbytes))
+    return jsonbytes
+
 
 class BenchmarkValidationMixin:
     def validate_benchmark(self, schema):
@@ -29,13 +83,11 @@ class BenchmarkValidationMixin:
 
 
 class BenchmarkEntityAPI(ApiEndpoint, BenchmarkValidationMixin):
-    serializer = BenchmarkResultSerializer()
-    schema = BenchmarkResultFacadeSchema()
-
     def _get(self, benchmark_result_id):
-        try:
-            benchmark_result = BenchmarkResult.one(id=benchmark_result_id)
-        except NotFound:
+        # Session.get() looks into the session's identity map first, and only
+        # then emits a primary key lookup query.
+        benchmark_result = current_session.get(BenchmarkResult, benchmark_result_id)
+        if benchmark_result is None:
             self.abort_404_not_found()
         return benchmark_result
 
@@ -58,7 +110,14 @@ class BenchmarkEntityAPI(ApiEndpoint, BenchmarkValidationMixin):
           - Benchmarks
         """
         benchmark_result = self._get(benchmark_result_id)
-        return self.serializer.one.dump(benchmark_result)
+        resp = json_response_for_byte_sequence(
+            orjson.dumps(benchmark_result.to_dict_for_json_api()), 200
+        )
+        # Set an ETag derived from the response body, and respond with 304 Not
+        # Modified if the client already has this version (If-None-Match).
+        # That saves transferring the (potentially large) body.
+        resp.add_etag()
+        return resp.make_conditional(f.request)
 
     @flask_login.login_required
     def put(self, benchmark_result_id):
@@ -82,9 +141,12 @@ class BenchmarkEntityAPI(ApiEndpoint, BenchmarkValidationMixin):
           - Benchmarks
         """
         benchmark_result = self._get(benchmark_result_id)
-        data = self.validate_benchmark(self.schema.update)
+        data = self.validate_benchmark(_SCHEMA_UPDATE)
         benchmark_result.update(data)
-        return self.serializer.one.dump(benchmark_result)
+        _ROW_JSON_CACHE.pop(benchmark_result_id)
+        return json_response_for_byte_sequence(
+            orjson.dumps(benchmark_result.to_dict_for_json_api()), 200
+        )
 
     @flask_login.login_required
     def delete(self, benchmark_result_id):
@@ -105,12 +167,46 @@ class BenchmarkEntityAPI(ApiEndpoint, BenchmarkValidationMixin):
         """
         benchmark_result = self._get(benchmark_result_id)
         benchmark_result.delete()
+        _ROW_JSON_CACHE.pop(benchmark_result_id)
         return self.response_204_no_content()
 
 
+@dataclass(frozen=True)
+class _ListQueryArgs:
+    """Query parameters of `GET /api/benchmark-results/`, parsed and
+    validated. Empty values are normalized to None."""
+
+    run_id: Optional[str]
+    run_reason: Optional[str]
+    # None for the first page (parameter not set, empty, or "null").
+    cursor: Optional[str]
+    page_size: int
+    earliest_timestamp: Optional[str]
+    latest_timestamp: Optional[str]
+
+
 class BenchmarkListAPI(ApiEndpoint, BenchmarkValidationMixin):
-    serializer = BenchmarkResultSerializer()
-    schema = BenchmarkResultFacadeSchema()
+    def _parse_list_query_args(self) -> _ListQueryArgs:
+        """Parse all query parameters in one go, or abort with 400."""
+        args = f.request.args
+
+        try:
+            page_size = int(args.get("page_size", 100))
+            assert 1 <= page_size <= 1000
+        except Exception:
+            self.abort_400_bad_request(
+                "page_size must be a positive integer no greater than 1000"
+            )
+
+        cursor = args.get("cursor")
+        return _ListQueryArgs(
+            run_id=args.get("run_id") or None,
+            run_reason=args.get("run_reason") or None,
+            cursor=None if cursor == "null" else cursor or None,
+            page_size=page_size,
+            earliest_timestamp=args.get("earliest_timestamp") or None,
+            latest_timestamp=args.get("latest_timestamp") or None,
+        )
 
     @maybe_login_required
     def get(self) -> f.Response:
@@ -195,51 +291,72 @@ class BenchmarkListAPI(ApiEndpoint, BenchmarkValidationMixin):
         tags:
           - Benchmarks
         """
+        args = self._parse_list_query_args()
         filters = []
 
-        if run_id_arg := f.request.args.get("run_id"):
+        if args.run_id:
             # It's assumed that the number of benchmark results corresponding to one
             # run_id won't increase unbounded over time (since runs end at some point).
             # So we don't have to filter out "old" results.
-            filters.append(BenchmarkResult.run_id == run_id_arg)
+            filters.append(BenchmarkResult.run_id == args.run_id)
         else:
             # All Conbench instances used a non-UUID7 primary key for benchmark results
             # before this date. We need to filter those out or they will be mixed in to
             # the results here, which will mess up the ordering.
             filters.append(BenchmarkResult.timestamp >= "2023-06-03")
 
-        if earliest_timestamp_arg := f.request.args.get("earliest_timestamp"):
-            filters.append(BenchmarkResult.timestamp >= earliest_timestamp_arg)
+        if args.earliest_timestamp:
+            filters.append(BenchmarkResult.timestamp >= args.earliest_timestamp)
 
-        if latest_timestamp_arg := f.request.args.get("latest_timestamp"):
-            filters.append(BenchmarkResult.timestamp <= latest_timestamp_arg)
+        if args.latest_timestamp:
+            filters.append(BenchmarkResult.timestamp <= args.latest_timestamp)
 
-        if run_reason_arg := f.request.args.get("run_reason"):
-            filters.append(BenchmarkResult.run_reason == run_reason_arg)
+        if args.run_reason:
+            filters.append(BenchmarkResult.run_reason == args.run_reason)
 
-        cursor_arg = f.request.args.get("cursor")
-        if cursor_arg and cursor_arg != "null":
-            filters.append(BenchmarkResult.id < cursor_arg)
+        if args.cursor:
+            filters.append(BenchmarkResult.id < args.cursor)
 
-        page_size = f.request.args.get("page_size", 100)
-        try:
-            page_size = int(page_size)
-            assert 1 <= page_size <= 1000
-        except Exception:
-            self.abort_400_bad_request(
-                "page_size must be a positive integer no greater than 1000"
-            )
+        page_size = args.page_size
 
+        # By default, all relationships of BenchmarkResult are loaded via JOIN
+        # for each row. Info and context are not needed for the JSON object
+        # (only their IDs, which are columns). Case, commit and hardware are
+        # typically shared by many results in a page: load each distinct one
+        # only once, via SELECT ... IN.
         query = (
             select(BenchmarkResult)
+            .options(
+                selectinload(BenchmarkResult.case),
+                selectinload(BenchmarkResult.commit),
+                selectinload(BenchmarkResult.hardware),
+                lazyload(BenchmarkResult.info),
+                lazyload(BenchmarkResult.context),
+            )
             .filter(*filters)
             .order_by(BenchmarkResult.id.desc())
             .limit(page_size)
         )
-        benchmark_results = current_session.scalars(query).all()
-
-        if len(benchmark_results) == page_size:
-            next_page_cursor = benchmark_results[-1].id
+        # See https://github.com/conbench/conbench/issues/999 -- for rather
+        # typical queries, using orjson instead of stdlib can significantly
+        # cut JSON serialization time. Serialize each result individually
+        # (or take it from the cache) while iterating over the query result,
+        # and assemble the JSON document from the fragments. Neither a list of
+        # all result dicts nor of all ORM objects is built here. Keep track of
+        # the last ID for the next page's cursor.
+        fragments: List[bytes] = []
+        last_id: Optional[str] = None
+        # Read-only query: allow for a read replica to serve it. Do not use the
+        # row JSON cache in that case: a lagging replica may return a result
+        # as it was before a PUT (which dropped the cache entry); caching that
+        # would extend the replica lag to the cache TTL.
+        use_cache = not read_session_is_replica()
+        for r in current_read_session.scalars(query):
+            fragments.append(_benchmark_result_json(r, use_cache))
+            last_id = r.id
+
+        if len(fragments) == page_size:
+            next_page_cursor = last_id
             # There's an edge case here where the last page happens to have exactly
             # page_size results. So the client will grab one more (empty) page. The
             # alternative would be to query the DB here, every single time, to *make
@@ -248,18 +365,30 @@ class BenchmarkListAPI(ApiEndpoint, BenchmarkValidationMixin):
             # If there were fewer than page_size results, the next page should be empty
             next_page_cursor = None
 
-        # See https://github.com/conbench/conbench/issues/999 -- for rather
-        # typical queries, using orjson instead of stdlib can significantly
-        # cut JSON serialization time.
-        jsonbytes: bytes = orjson.dumps(
-            {
-                "data": [r.to_dict_for_json_api() for r in benchmark_results],
-                "metadata": {"next_page_cursor": next_page_cursor},
-            },
-            option=orjson.OPT_INDENT_2,
+        jsonbytes: bytes = (
+            b'{"data":['
+            + b",".join(fragments)
+            + b'],"metadata":'
+            + orjson.dumps({"next_page_cursor": next_page_cursor})
+            + b"}"
         )
 
-        return json_response_for_byte_sequence(jsonbytes, 200)
+        resp = json_response_for_byte_sequence(jsonbytes, 200)
+
+        # A page requested with a cursor contains only results inserted before
+        # the cursor result: its set of results is stable. Its content is not
+        # (PUT/DELETE, and embedded commit/hardware data may be backfilled
+        # after the fact). Allow for caching it for a short while; the TTL
+        # bounds that staleness. Do not allow for shared caches to store it if
+        # benchmark data is not public (login required).
+        if args.cursor and Config.API_RESULTS_LIST_CACHE_MAX_AGE > 0:
+            resp.cache_control.max_age = Config.API_RESULTS_LIST_CACHE_MAX_AGE
+            if as_bool(os.getenv("BENCHMARKS_DATA_PUBLIC", "yes")):
+                resp.cache_control.public = True
+            else:
+                resp.cache_control.private = True
+
+        return resp
 
     @flask_login.login_required
     def post(self) -> f.Response:
@@ -286,7 +415,7 @@ class BenchmarkListAPI(ApiEndpoint, BenchmarkValidationMixin):
         """
         # Here it should be easy to make `data` have a precise type (that mypy
         # can use) based on the schema that we validate against.
-        data = self.validate_benchmark(self.schema.create)
+        data = self.validate_benchmark(_SCHEMA_CREATE)
 
         try:
             benchmark_result = BenchmarkResult.create(data)
@@ -294,11 +423,17 @@ class BenchmarkListAPI(ApiEndpoint, BenchmarkValidationMixin):
             return resp400(str(exc))
 
         # Rely on the idea that the lookup
-        # `benchmark_result.commit_repo_url` always succeeds
-        conbench.metrics.COUNTER_BENCHMARK_RESULTS_INGESTED.labels(
-            repourl=benchmark_result.commit_repo_url
-        ).inc()
-        return self.response_201_created(self.serializer.one.dump(benchmark_result))
+        # `benchmark_result.commit_repo_url` always succeeds (it is a plain
+        # column value, set in BenchmarkResult.create()).
+        conbench.metrics.inc_benchmark_results_ingested(
+            benchmark_result.commit_repo_url
+        )
+        # Serialize with orjson (instead of returning the dict to Flask, which
+        # would use the stdlib-based JSON encoder).
+        body = benchmark_result.to_dict_for_json_api()
+        resp = json_response_for_byte_sequence(orjson.dumps(body), 201)
+        resp.headers["Location"] = body["links"]["self"]
+        return resp
 
 
 benchmark_entity_view = BenchmarkEntityAPI.as_view("benchmark")
@@ -329,9 +464,5 @@ rule(
     view_func=benchmark_entity_view,
     methods=["GET", "DELETE", "PUT"],
 )
-spec.components.schema(
-    "BenchmarkResultCreate", schema=BenchmarkResultFacadeSchema.create
-)
-spec.components.schema(
-    "BenchmarkResultUpdate", schema=BenchmarkResultFacadeSchema.update
-)
+spec.components.schema("BenchmarkResultCreate", schema=_SCHEMA_CREATE)
+spec.components.schema("BenchmarkResultUpdate", schema=_SCHEMA_UPDATE)
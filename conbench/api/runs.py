@@ -4,6 +4,7 @@ from typing import Dict, Optional, Sequence, Set
 
 import flask as f
 import sqlalchemy as s
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from ..api import rule
 from ..api._endpoint import ApiEndpoint, maybe_login_required
@@ -112,9 +113,12 @@ def _search_for_baseline_run(
         .select_from(BenchmarkResult)
         .join(Commit, Commit.id == BenchmarkResult.commit_id)
         .filter(
-            BenchmarkResult.history_fingerprint.in_(contender_history_fingerprints),
+            # `= ANY(array)` instead of `IN (...)`: one statement shape
+            # regardless of the number of fingerprints and commits.
+            BenchmarkResult.history_fingerprint
+            == s.any_(s.literal(list(contender_history_fingerprints), ARRAY(s.Text))),
             BenchmarkResult.run_id != contender_run_id,
-            BenchmarkResult.commit_id.in_(commit_ids),
+            BenchmarkResult.commit_id == s.any_(s.literal(commit_ids, ARRAY(s.Text))),
             BenchmarkResult.timestamp >= earliest_commit_timestamp,  # a nice speedup
         )
         .order_by(
@@ -1,5 +1,8 @@
+import threading
 import time
+from collections import OrderedDict
 from functools import lru_cache, wraps
+from typing import Any, Hashable, Tuple
 
 
 def lru_cache_with_ttl(maxsize=None, typed=False, ttl=60):
@@ -37,3 +40,44 @@ def lru_cache_with_ttl(maxsize=None, typed=False, ttl=60):
         return wrapper
 
     return decorator
+
+
+class LRUCacheWithTTL:
+    """Thread-safe mapping with a maximum size (least recently used items are
+    evicted first) and a notion of expiration time, for explicit get/set/pop
+    use (where a function-decorating cache does not fit).
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the value for `key`, or None if not present or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            deadline, value = item
+            if deadline < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
@@ -17,6 +17,18 @@ class ConfigClass:
         f"postgresql://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     )
 
+    # Optional: host of a (streaming) read replica of the database, reachable
+    # with the same port, credentials and database name. When set, selected
+    # read-only queries (currently: listing benchmark results) are sent there
+    # instead of to the primary. Note that such reads may lag behind writes
+    # (replication delay). When not set, all queries go to the primary.
+    DB_READ_REPLICA_HOST = os.environ.get("DB_READ_REPLICA_HOST", None)
+    SQLALCHEMY_DATABASE_URI_READ_REPLICA = (
+        f"postgresql://{DB_USERNAME}:{DB_PASSWORD}@{DB_READ_REPLICA_HOST}:{DB_PORT}/{DB_NAME}"
+        if DB_READ_REPLICA_HOST
+        else None
+    )
+
     # When this appears to be `true` then the application initialization phase
     # executes code that _attempts_ to create all database tables. That code
     # does not error out when it finds that the database tables already exist.
@@ -29,6 +41,23 @@ class ConfigClass:
     # default.
     DISTRIBUTION_COMMITS = int(os.environ.get("DISTRIBUTION_COMMITS", 100))
 
+    # Cache-Control max-age (in seconds) for pages of GET /api/benchmark-results/
+    # that were requested with a `cursor` (the first page is never marked as
+    # cacheable: it changes whenever new results come in). Allows for an HTTP
+    # cache in front of Conbench to absorb repeated pagination. 0 disables.
+    API_RESULTS_LIST_CACHE_MAX_AGE = int(
+        os.environ.get("CONBENCH_API_RESULTS_LIST_CACHE_MAX_AGE", 30)
+    )
+
+    # Number of request-handling threads allowed to work on an /api/compare/...
+    # request at the same time (see compare.py). The default of 1 is
+    # deliberate: compare requests are CPU-bound Python (serialized by the GIL
+    # within one process), and each thread holding such a request is not
+    # available for serving other requests.
+    API_COMPARE_MAX_CONCURRENCY = int(
+        os.environ.get("CONBENCH_API_COMPARE_MAX_CONCURRENCY", 1)
+    )
+
     LOG_LEVEL_STDERR = os.environ.get("CONBENCH_LOG_LEVEL_STDERR", "INFO")
     LOG_LEVEL_FILE = None
     LOG_LEVEL_SQLALCHEMY = "WARNING"
@@ -14,6 +14,11 @@ from .config import Config
 engine = None
 session_maker = sqlalchemy.orm.sessionmaker()
 
+# Session factory for read-only queries that may be served by a read replica.
+# Bound to the primary's engine if no read replica is configured.
+read_engine = None
+read_session_maker = sqlalchemy.orm.sessionmaker()
+
 # Module-global sqlalchemy session object, do not re-use in other modules.
 # This is for DB interaction that happens outside of HTTP request processing
 # context.
@@ -32,11 +37,24 @@ if "pytest" in sys.modules:
     logfunc = log.debug
 
 
-def configure_engine(url):
-    global engine, session_maker
+def configure_engine(url, read_replica_url=None):
+    global engine, read_engine
 
     logfunc("create sqlalchemy DB engine")
-    engine = create_engine(
+    engine = _create_engine(url)
+    logfunc("bind engine to session")
+    session_maker.configure(bind=engine)
+
+    if read_replica_url:
+        logfunc("create sqlalchemy DB engine for read replica")
+        read_engine = _create_engine(read_replica_url)
+    else:
+        read_engine = engine
+    read_session_maker.configure(bind=read_engine)
+
+
+def _create_engine(url):
+    return create_engine(
         url,
         echo=False,
         pool_pre_ping=True,
@@ -68,8 +86,6 @@ def configure_engine(url):
         # parser.
         json_deserializer=orjson.loads,  # pylint: disable=E1101
     )
-    logfunc("bind engine to session")
-    session_maker.configure(bind=engine)
 
 
 # compute this only once.
@@ -19,7 +19,12 @@ from werkzeug.local import LocalProxy
 # HTTP request context.
 from conbench.db import _session as out_of_req_context_db_session
 
-__all__ = ["current_session", "flask_scoped_session"]
+__all__ = [
+    "current_session",
+    "current_read_session",
+    "read_session_is_replica",
+    "flask_scoped_session",
+]
 
 # Plan for only using threading.
 from threading import get_ident as get_cur_thread
@@ -60,20 +65,45 @@ not been initialized with a :class:`flask_scoped_session`
 """
 
 
+def _get_read_session():
+    session = _get_session()
+    if session is out_of_req_context_db_session:
+        return session
+
+    # `read_scoped_session` is only set if a read replica is configured.
+    # Otherwise, use the same session as `current_session`.
+    return getattr(current_app._get_current_object(), "read_scoped_session", session)
+
+
+# Like `current_session`, but for read-only queries that may be served by a
+# database read replica (if configured). Data read via this session may lag
+# behind writes. Do not use it for modifying data.
+current_read_session: scoped_session = LocalProxy(_get_read_session)  # type: ignore[assignment]
+
+
+def read_session_is_replica() -> bool:
+    """Return True if `current_read_session` is served by a read replica
+    (i.e. if it is not the same session as `current_session`)."""
+    return _get_read_session() is not _get_session()
+
+
 class flask_scoped_session(scoped_session):
     """A :class:`~sqlalchemy.orm.scoping.scoped_session` whose scope is set to
     the Flask application context.
     """
 
-    def __init__(self, session_factory, app=None):
+    def __init__(self, session_factory, app=None, app_attr="scoped_session"):
         """
         :param session_factory: A callable that returns a
             :class:`~sqlalchemy.orm.session.Session`
         :param app: a :class:`~flask.Flask` application
+        :param app_attr: name of the attribute to set on the application
+            object (allows for registering more than one scoped session)
         """
         super(flask_scoped_session, self).__init__(
             session_factory, scopefunc=get_cur_thread
         )
+        self._app_attr = app_attr
         # the _app_ctx_stack.__ident_func__ is the greenlet.get_current, or
         # thread.get_ident if no greenlets are used.
         # each Flask request is launched in a seperate greenlet/thread, so our
@@ -87,7 +117,7 @@ class flask_scoped_session(scoped_session):
             self.init_app(app)
 
     def init_app(self, app):
-        app.scoped_session = self
+        setattr(app, self._app_attr, self)
 
         @app.teardown_appcontext
         def remove_scoped_session(*args, **kwargs):
@@ -99,4 +129,4 @@ class flask_scoped_session(scoped_session):
             # teardown_appcontext() functions are executed". The remove method
             # is documented here:
             # https://docs.sqlalchemy.org/en/14/orm/contextual.html#sqlalchemy.orm.scoped_session.remove
-            app.scoped_session.remove()
+            self.remove()
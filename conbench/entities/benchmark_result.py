@@ -16,7 +16,7 @@ import sigfig
 import sqlalchemy as s
 from sqlalchemy import CheckConstraint as check
 from sqlalchemy.dialects import postgresql
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.orm import Mapped, query_expression, relationship
 
 import conbench.units
 import conbench.util
@@ -160,6 +160,12 @@ class BenchmarkResult(Base, EntityMixin):
     validation: Mapped[Optional[dict]] = Nullable(postgresql.JSONB)
     change_annotations: Mapped[Optional[dict]] = Nullable(postgresql.JSONB)
 
+    # Lookback z-score of this result relative to a baseline distribution. Not
+    # a DB column: the baseline distribution depends on the (request-specific)
+    # baseline commit. This is None unless populated via set_z_scores() (or
+    # via `with_expression()` in a query).
+    z_score: Mapped[Optional[float]] = query_expression()
+
     @staticmethod
     # We should work towards having a precise type annotation for `data`. It's
     # the result of a (marshmallow) schema-validated JSON deserialization, and
@@ -334,7 +340,13 @@ class BenchmarkResult(Base, EntityMixin):
         tags.update(case.tags)
 
         if benchmark_result.commit:
-            commit_dict = CommitSerializer().one.dump(benchmark_result.commit)
+            # Skip the parent commit lookup (a DB query), only needed for
+            # building `links.parent` -- but `links` is removed here anyway.
+            # Serializing a page of results would otherwise emit one such
+            # query per result.
+            commit_dict = CommitSerializer().one._dump(
+                benchmark_result.commit, include_parent_link=False
+            )
             commit_dict.pop("links", None)
         else:
             commit_dict = None
@@ -1122,7 +1134,8 @@ def generate_history_fingerprint(
     return hash.hexdigest()
 
 
-s.Index("benchmark_result_run_id_index", BenchmarkResult.run_id)
+# Note: lookups by run_id alone are served by the composite
+# benchmark_result_run_id_id_idx index below (run_id is its leading column).
 s.Index("benchmark_result_case_id_index", BenchmarkResult.case_id)
 
 # Note(JP): we provde an API endpoint that allows for querying all benchmark
@@ -1157,6 +1170,15 @@ s.Index(
     BenchmarkResult.id,
     postgresql_where=(BenchmarkResult.timestamp >= "2023-06-03"),
 )
+# When filtering by run_id, the pagination query does not apply the timestamp
+# fence above. This allows for serving `WHERE run_id = ... [AND id < ...]
+# ORDER BY id DESC LIMIT ...` from a single index range scan, without sorting.
+# Also serves all other lookups by run_id.
+s.Index(
+    "benchmark_result_run_id_id_idx",
+    BenchmarkResult.run_id,
+    BenchmarkResult.id,
+)
 
 
 class _Serializer(EntitySerializer):
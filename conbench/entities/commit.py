@@ -320,7 +320,15 @@ s.Index(
 
 
 class _Serializer(EntitySerializer):
-    def _dump(self, commit):
+    def _dump(self, commit, include_parent_link: Optional[bool] = None):
+        """
+        `include_parent_link`: whether to look up the parent commit (a DB
+        query) for setting `links.parent`. Defaults to doing so for the `one`
+        flavor only.
+        """
+        if include_parent_link is None:
+            include_parent_link = not self.many
+
         url = None
         if commit.repository and commit.sha:
             url = f"{commit.repository}/commit/{commit.sha}"
@@ -343,7 +351,7 @@ class _Serializer(EntitySerializer):
                 "self": f.url_for("api.commit", commit_id=commit.id, _external=True),
             },
         }
-        if not self.many:
+        if include_parent_link:
             parent, parent_url = commit.get_parent_commit(), None
             if parent:
                 parent_url = f.url_for(
@@ -1,3 +1,4 @@
+import functools
 from typing import Dict
 
 import flask as f
@@ -23,6 +24,15 @@ class Context(Base, EntityMixin["Context"]):
         """
         return self.tags
 
+    @functools.cached_property
+    def benchmark_language(self) -> str:
+        """
+        Return the benchmark language as specified in the context tags, or
+        "unknown". Cached: one Context object is typically shared by many
+        benchmark result objects.
+        """
+        return self.tags.get("benchmark_language", "unknown")
+
 
 s.Index("context_index", Context.tags, unique=True)
 
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Tuple, Union, cast
 import numpy as np
 import pandas as pd
 import sqlalchemy as s
+from sqlalchemy.dialects.postgresql import ARRAY
 
 import conbench.units
 from conbench.dbsession import current_session
@@ -383,7 +384,10 @@ def _query_and_calculate_distribution_stats(
     ).filter(
         BenchmarkResult.error.is_(None),
         BenchmarkResult.mean.is_not(None),
-        BenchmarkResult.commit_id.in_(commit_timestamps_by_id.keys()),
+        # `= ANY(array)` instead of `IN (...)`: one statement shape regardless
+        # of the number of commits.
+        BenchmarkResult.commit_id
+        == s.any_(s.literal(list(commit_timestamps_by_id), ARRAY(s.Text))),
         BenchmarkResult.timestamp >= earliest_commit_timestamp,  # a nice speedup
     )
 
@@ -394,13 +398,16 @@ def _query_and_calculate_distribution_stats(
             BenchmarkResult.history_fingerprint == history_fingerprint
         )
     else:
-        # filter to *any* history fingerprint associated with this run_id
-        these_fingerprints = set(
-            current_session.scalars(
-                s.select(BenchmarkResult.history_fingerprint).filter(
-                    BenchmarkResult.run_id == contender_run_id
-                )
-            ).all()
+        # filter to *any* history fingerprint associated with this run_id. Do
+        # this via a subquery so that the database resolves the set of
+        # fingerprints itself: that saves one round trip and the transfer of
+        # (potentially thousands of) fingerprints in both directions.
+        these_fingerprints = (
+            s.select(BenchmarkResult.history_fingerprint)
+            .filter(BenchmarkResult.run_id == contender_run_id)
+            .distinct()
+            .correlate(None)
+            .scalar_subquery()
         )
         history = history.filter(
             BenchmarkResult.history_fingerprint.in_(these_fingerprints)
@@ -1,5 +1,33 @@
+import flask.json.provider
 import flask_bootstrap
 import flask_login
+import orjson
 
 login_manager = flask_login.LoginManager()
 bootstrap = flask_bootstrap.Bootstrap()
+
+
+class OrjsonLoadsJSONProvider(flask.json.provider.DefaultJSONProvider):
+    """
+    Decode JSON request bodies (`request.get_json()`) with orjson. This
+    matters for large submissions (benchmark results with many samples).
+
+    Keep the stdlib-based default for encoding: `jsonify()` is used with types
+    (Decimal, ...) that orjson does not serialize.
+    """
+
+    def loads(self, s, **kwargs):
+        # Other callers pass stdlib-specific arguments. For example, Flask's
+        # session cookie serializer passes `object_hook` for decoding tagged
+        # values (e.g. flashed messages). orjson does not support these.
+        if kwargs:
+            return super().loads(s, **kwargs)
+
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # The stdlib decoder accepts input that orjson rejects (e.g. the
+            # NaN/Infinity literals, integers beyond 64 bit). Retain that
+            # behavior. For invalid JSON this raises ValueError, too, i.e.
+            # `get_json()` still results in a 400 Bad Request response.
+            return super().loads(s)
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 from conbench.entities.benchmark_result import BenchmarkResult
 
@@ -26,6 +26,15 @@ def _get_case_kvpair_strings(tags: Dict[str, str]) -> List[str]:
     return [f"{k}={v}" for k, v in sorted(tags.items()) if k not in ("name")]
 
 
+def _get_case_permutation_string(tags: Dict[str, str]) -> str:
+    caseperm_string_chunks = _get_case_kvpair_strings(tags)
+
+    if len(caseperm_string_chunks) == 0:
+        return "no-permutations"
+
+    return ", ".join(caseperm_string_chunks)
+
+
 def set_display_case_permutation(bmresult: Dict | BenchmarkResult):
     """
     Build and set a string reflecting the case permutation (specific variation
@@ -66,11 +75,7 @@ def set_display_case_permutation(bmresult: Dict | BenchmarkResult):
         if "name" not in tags:
             log.warning("dict bm result w/o name in tags")
 
-    caseperm_string_chunks = _get_case_kvpair_strings(tags)
-
-    result = ", ".join(caseperm_string_chunks)
-    if len(caseperm_string_chunks) == 0:
-        result = "no-permutations"
+    result = _get_case_permutation_string(tags)
 
     if isinstance(bmresult, BenchmarkResult):
         bmresult.display_case_perm = result
@@ -96,6 +101,33 @@ def set_display_benchmark_name(bmresult):
         bmresult.display_bmname = name
 
 
+def bulk_annotate(bmresults: Iterable[BenchmarkResult]) -> None:
+    """
+    Set `display_bmname` and `display_case_perm` on each of the benchmark
+    result objects in a single pass. Equivalent to calling
+    set_display_benchmark_name() and set_display_case_permutation() for each
+    of them.
+
+    Typically, many results share the same Case object: build the case
+    permutation string only once per case.
+    """
+    caseperm_by_case_id: Dict[str, str] = {}
+
+    for bmresult in bmresults:
+        case = bmresult.case
+        bmresult.display_bmname = case.name
+
+        caseperm = caseperm_by_case_id.get(case.id)
+        if caseperm is None:
+            # Re-add the benchmark name into tags, see
+            # set_display_case_permutation().
+            case.tags["name"] = case.name
+            caseperm = _get_case_permutation_string(case.tags)
+            caseperm_by_case_id[case.id] = caseperm
+
+        bmresult.display_case_perm = caseperm
+
+
 def sorted_data(benchmarks):
     """
     TODO: identify what this does, assess the value, and re-implement in
@@ -19,6 +19,7 @@ import logging
 import os
 import threading
 import time
+from typing import Dict
 
 import flask
 import prometheus_client
@@ -91,6 +92,22 @@ COUNTER_BENCHMARK_RESULTS_INGESTED = prometheus_client.Counter(
     labelnames=["repourl"],
 )
 
+# Child counter per `repourl` label value. `labels()` validates and hashes the
+# label values on each call (and takes a lock); do that only once per value.
+_COUNTERS_BENCHMARK_RESULTS_INGESTED_BY_REPOURL: Dict[
+    str, prometheus_client.Counter
+] = {}
+
+
+def inc_benchmark_results_ingested(repourl: str) -> None:
+    counter = _COUNTERS_BENCHMARK_RESULTS_INGESTED_BY_REPOURL.get(repourl)
+    if counter is None:
+        # Racing threads may both call labels() here; that is fine, it
+        # returns the same child object.
+        counter = COUNTER_BENCHMARK_RESULTS_INGESTED.labels(repourl=repourl)
+        _COUNTERS_BENCHMARK_RESULTS_INGESTED_BY_REPOURL[repourl] = counter
+    counter.inc()
+
 
 def decorate_flask_app_with_metrics(app) -> None:
     """
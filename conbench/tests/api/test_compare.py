@@ -1,15 +1,53 @@
+import math
 from typing import List, Optional, Set, Tuple
 
 import pytest
 
 from ...api._examples import _api_compare_entity, _api_compare_list
-from ...api.compare import CompareRunsAPI, _round
+from ...api.compare import (
+    BenchmarkResultComparator,
+    CompareRunsAPI,
+    _dicts_for_api_json,
+    _round,
+)
+from ...numstr import numstr
 from ...tests.api import _asserts, _fixtures
 from ...tests.helpers import _uuid
 
 CASE = "compression=snappy, cpu_count=2, dataset=nyctaxi_sample, file_type=parquet, input_type=arrow"
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        0.0,
+        -0.0,
+        math.inf,
+        -math.inf,
+        9999.5,
+        -9999.5,
+        99995.0,
+        1.0005,
+        0.99995,
+        2.675e-3,
+        -2.675e-3,
+        -1.23456,
+        123456.0,
+        1e-12,
+        1e20,
+        9.9995e307,
+        1.7976931348623157e308,
+        -1.7976931348623157e308,
+    ],
+)
+def test_round_equivalent_to_numstr(value):
+    assert _round(value) == float(numstr(value, sigfigs=4))
+
+
+def test_round_nan():
+    assert _round(math.nan) is None
+
+
 class FakeEntity:
     def __init__(self, _id):
         self.id = _id
@@ -18,7 +56,12 @@ class FakeEntity:
 class TestJoinResults:
     @staticmethod
     def _fake_benchmark_result(
-        benchmark_result_id, case_id, context_id, has_commit=True
+        benchmark_result_id,
+        case_id,
+        context_id,
+        has_commit=True,
+        unit="unit 1",
+        is_failed=False,
     ):
         """Just for this testing class, return a fake BenchmarkResult from which a
         case/context/hardware/repo/unit key can be extracted.
@@ -30,7 +73,8 @@ class TestJoinResults:
         commit = FakeEntity("")
         commit.repository = "repo 1"
         result = FakeEntity(benchmark_result_id)
-        result.unit = "unit 1"
+        result.unit = unit
+        result.is_failed = is_failed
         result.case_id = case_id
         result.context_id = context_id
         result.hardware = hardware
@@ -126,6 +170,44 @@ class TestJoinResults:
             (None, "id00"),
         }
 
+    def test_units_dont_match_so_dont_pair(self):
+        baselines = [
+            self._fake_benchmark_result("id1", "case 1", "context 1"),
+            self._fake_benchmark_result("id2", "case 2", "context 2"),
+            self._fake_benchmark_result("id3", "case 3", "context 3"),
+        ]
+        contenders = [
+            self._fake_benchmark_result("id4", "case 1", "context 1"),
+            self._fake_benchmark_result("id5", "case 2", "context 2", unit="unit 2"),
+            self._fake_benchmark_result("id6", "case 3", "context 3", unit="unit 2"),
+        ]
+        pairs = CompareRunsAPI._join_results(baselines, contenders)
+        assert self._parse_ids_from_pairs(pairs) == {("id1", "id4")}
+
+    def test_failed_results_pair_regardless_of_unit(self):
+        # Errored results may or may not carry a (user-given, unvalidated)
+        # unit. They still pair with their counterpart.
+        baselines = [
+            self._fake_benchmark_result("id1", "case 1", "context 1", is_failed=True),
+            self._fake_benchmark_result(
+                "id2", "case 2", "context 2", unit=None, is_failed=True
+            ),
+            self._fake_benchmark_result("id3", "case 3", "context 3"),
+        ]
+        contenders = [
+            self._fake_benchmark_result("id4", "case 1", "context 1", unit="unit 2"),
+            self._fake_benchmark_result("id5", "case 2", "context 2"),
+            self._fake_benchmark_result(
+                "id6", "case 3", "context 3", unit="unit 2", is_failed=True
+            ),
+        ]
+        pairs = CompareRunsAPI._join_results(baselines, contenders)
+        assert self._parse_ids_from_pairs(pairs) == {
+            ("id1", "id4"),
+            ("id2", "id5"),
+            ("id3", "id6"),
+        }
+
     def test_contexts_dont_match_so_dont_pair(self):
         baselines = [
             self._fake_benchmark_result("id1", "case 1", "context 1"),
@@ -184,6 +266,133 @@ class TestJoinResults:
         }
 
 
+class TestDictsForApiJson:
+    @staticmethod
+    def _fake_benchmark_result(
+        benchmark_result_id, svs, unit="s", is_failed=False, z_score=None
+    ):
+        """Return a fake BenchmarkResult providing what BenchmarkResultComparator
+        needs for emitting its API JSON representation.
+        """
+        context = FakeEntity("")
+        context.benchmark_language = "Python"
+        case = FakeEntity("")
+        case.tags = {"name": "bm"}
+        result = FakeEntity(benchmark_result_id)
+        result.svs = svs
+        result.unit = unit
+        result.unitsymbol = unit
+        result.is_failed = is_failed
+        result.z_score = z_score
+        result.error = {"stack_trace": "..."} if is_failed else None
+        result.display_bmname = "bm"
+        result.display_case_perm = "case"
+        result.batch_id = "batch"
+        result.run_id = "run"
+        result.context = context
+        result.case = case
+        return result
+
+    def test_empty(self):
+        assert list(_dicts_for_api_json([])) == []
+
+    def _analysis(self, baseline, contender, threshold=5.0, threshold_z=5.0):
+        comparator = BenchmarkResultComparator(
+            baseline, contender, threshold, threshold_z
+        )
+        (d,) = _dicts_for_api_json([comparator])
+        # The single-comparator code path emits the same.
+        assert comparator._dict_for_api_json == d
+        return d["analysis"]
+
+    @pytest.mark.parametrize(
+        "unit, percent_change", [("s", -10.0), ("B/s", 10.0)]
+    )  # less-is-better, more-is-better
+    def test_pairwise(self, unit, percent_change):
+        fr = self._fake_benchmark_result
+        analysis = self._analysis(fr("b", 10.0, unit), fr("c", 11.0, unit))
+        assert analysis["pairwise"] == {
+            "percent_change": percent_change,
+            "percent_threshold": 5.0,
+            "regression_indicated": percent_change < 0,
+            "improvement_indicated": percent_change > 0,
+        }
+        analysis = self._analysis(
+            fr("b", 10.0, unit), fr("c", 11.0, unit), threshold=15.0
+        )
+        assert not analysis["pairwise"]["regression_indicated"]
+        assert not analysis["pairwise"]["improvement_indicated"]
+
+    def test_pairwise_zero_baseline(self):
+        fr = self._fake_benchmark_result
+        analysis = self._analysis(fr("b", 0.0), fr("c", 3.0, z_score=2.5))
+        assert analysis["pairwise"] is None
+        assert analysis["lookback_z_score"] is not None
+
+    @pytest.mark.parametrize(
+        "z_score, regression_indicated, improvement_indicated",
+        [(-6.0, True, False), (1.5, False, False), (6.0, False, True)],
+    )
+    def test_lookback_z_score(
+        self, z_score, regression_indicated, improvement_indicated
+    ):
+        fr = self._fake_benchmark_result
+        analysis = self._analysis(fr("b", 10.0), fr("c", 10.0, z_score=z_score))
+        assert analysis["lookback_z_score"] == {
+            "z_threshold": 5.0,
+            "z_score": z_score,
+            "regression_indicated": regression_indicated,
+            "improvement_indicated": improvement_indicated,
+        }
+
+    @pytest.mark.parametrize("z_score", [None, math.nan])
+    def test_lookback_z_score_not_available(self, z_score):
+        fr = self._fake_benchmark_result
+        analysis = self._analysis(fr("b", 10.0), fr("c", 11.0, z_score=z_score))
+        assert analysis["pairwise"] is not None
+        assert analysis["lookback_z_score"] is None
+
+    def test_failed_or_missing(self):
+        fr = self._fake_benchmark_result
+        null_analysis = {"pairwise": None, "lookback_z_score": None}
+        for baseline, contender in [
+            (fr("b", 2.0, is_failed=True), fr("c", 3.0, z_score=6.0)),
+            (fr("b", 2.0), fr("c", math.nan, is_failed=True)),
+            (None, fr("c", 3.0, z_score=6.0)),
+            (fr("b", 2.0), None),
+        ]:
+            assert self._analysis(baseline, contender) == null_analysis
+
+    def test_svs_accessed_once(self):
+        class CountingResult(FakeEntity):
+            svs_accesses = 0
+
+            @property
+            def svs(self):
+                self.svs_accesses += 1
+                return 2.0
+
+        def counting_result(benchmark_result_id):
+            attrs = vars(self._fake_benchmark_result(benchmark_result_id, None))
+            del attrs["svs"]
+            result = CountingResult(benchmark_result_id)
+            result.__dict__.update(attrs)
+            return result
+
+        comparators = [
+            BenchmarkResultComparator(
+                counting_result(f"b{i}"), counting_result(f"c{i}"), 5.0, 5.0
+            )
+            for i in range(3)
+        ]
+
+        dicts = list(_dicts_for_api_json(comparators))
+        assert [d["baseline"]["single_value_summary"] for d in dicts] == [2.0] * 3
+        for c in comparators:
+            assert c.baseline.svs_accesses == 1
+            assert c.contender.svs_accesses == 1
+
+
 class TestCompareBenchmarkResultsGet(_asserts.GetEnforcer):
     url = "/api/compare/benchmark-results/{}/"
     public = True
@@ -5,6 +5,7 @@ from typing import Tuple
 import pytest
 
 from ...api._examples import _api_benchmark_entity
+from ...config import Config
 from ...entities._entity import NotFound
 from ...entities.benchmark_result import BenchmarkResult
 from ...tests.api import _asserts, _fixtures
@@ -69,6 +70,20 @@ class TestBenchmarkGet(_asserts.GetEnforcer):
         response = client.get(f"/api/benchmarks/{benchmark_result.id}/")
         self.assert_200_ok(response, _expected_entity(benchmark_result))
 
+    def test_get_benchmark_etag(self, client):
+        self.authenticate(client)
+        benchmark_result = self._create()
+        response = client.get(f"/api/benchmarks/{benchmark_result.id}/")
+        self.assert_200_ok(response)
+        etag = response.headers["ETag"]
+
+        response = client.get(
+            f"/api/benchmarks/{benchmark_result.id}/",
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.data == b""
+
     def test_get_benchmark_regression(self, client):
         self.authenticate(client)
 
@@ -296,6 +311,26 @@ class TestBenchmarkUpdate(_asserts.PutEnforcer):
         response = client.get(self.url.format(benchmark_result.id))
         self.assert_200_ok(response, expected)
 
+    def test_update_change_annotations_reflected_in_list(self, client):
+        self.authenticate(client)
+        benchmark_result = self._create_entity_to_update()
+        list_url = f"/api/benchmark-results/?run_id={benchmark_result.run_id}"
+
+        # This populates the serialized-result cache of the list endpoint.
+        response = client.get(list_url)
+        self.assert_200_ok(response)
+        assert response.json["data"][0]["change_annotations"] == {}
+
+        response = client.put(
+            self.url.format(benchmark_result.id),
+            json={"change_annotations": {"a": True}},
+        )
+        self.assert_200_ok(response)
+
+        response = client.get(list_url)
+        self.assert_200_ok(response)
+        assert response.json["data"][0]["change_annotations"] == {"a": True}
+
 
 class TestBenchmarkDelete(_asserts.DeleteEnforcer):
     url = "/api/benchmarks/{}/"
@@ -424,6 +459,54 @@ class TestBenchmarkList(_asserts.ListEnforcer):
         assert len(benchmark_results) == expected_num_results
         assert pages_hit == 1
 
+    def test_benchmark_list_repeated(self, client):
+        self.authenticate(client)
+        # The second response is built from cached per-result JSON fragments.
+        response1 = client.get(f"{self.url}?page_size=1000")
+        self.assert_200_ok(response1)
+        response2 = client.get(f"{self.url}?page_size=1000")
+        self.assert_200_ok(response2)
+        assert len(response1.json["data"]) == 6
+        assert response1.data == response2.data
+
+    def _cursor_page_response(self, client):
+        first_page = self._make_request(client, page_size=2)
+        cursor = first_page["metadata"]["next_page_cursor"]
+        assert cursor
+        response = client.get(f"{self.url}?page_size=2&cursor={cursor}")
+        self.assert_200_ok(response)
+        return response
+
+    def test_benchmark_list_cache_control(self, client, monkeypatch):
+        monkeypatch.setenv("BENCHMARKS_DATA_PUBLIC", "on")
+        monkeypatch.setattr(Config, "API_RESULTS_LIST_CACHE_MAX_AGE", 30)
+        self.authenticate(client)
+
+        # The first page may gain results any time: don't allow caching it.
+        response = client.get(f"{self.url}?page_size=2")
+        self.assert_200_ok(response)
+        assert "Cache-Control" not in response.headers
+
+        response = self._cursor_page_response(client)
+        assert response.cache_control.max_age == 30
+        assert response.cache_control.public
+        assert not response.cache_control.private
+
+    def test_benchmark_list_cache_control_disabled(self, client, monkeypatch):
+        monkeypatch.setattr(Config, "API_RESULTS_LIST_CACHE_MAX_AGE", 0)
+        self.authenticate(client)
+        response = self._cursor_page_response(client)
+        assert "Cache-Control" not in response.headers
+
+    def test_benchmark_list_cache_control_public_data_off(self, client, monkeypatch):
+        monkeypatch.setenv("BENCHMARKS_DATA_PUBLIC", "off")
+        monkeypatch.setattr(Config, "API_RESULTS_LIST_CACHE_MAX_AGE", 30)
+        self.authenticate(client)
+        response = self._cursor_page_response(client)
+        assert response.cache_control.max_age == 30
+        assert response.cache_control.private
+        assert not response.cache_control.public
+
     @pytest.mark.parametrize("page_size", ["0", "1001", "-1", "asd"])
     def test_bad_page_size(self, client, page_size):
         self.authenticate(client)
@@ -33,6 +33,8 @@ class TestRegister(_asserts.AppEndpointTest):
         }
         response = client.post("/register/", data=data, follow_redirects=True)
         self.assert_login_page(response)
+        # Flashed before the redirect, rendered on the login page.
+        assert b"Welcome! Please login." in response.data
 
         # make sure you can login with this new user
         data = {
@@ -1,6 +1,7 @@
 import pytest
 
 from .. import create_application
+from ..api.results import clear_row_json_cache
 from ..config import TestConfig
 from ..db import _session as Session
 from ..db import configure_engine, create_all, drop_all, empty_db_tables
@@ -23,6 +24,8 @@ def create_db_tables():
 @pytest.fixture(autouse=True)
 def clear_db_state_between_tests():
     empty_db_tables()
+    # Do not let cached serialized benchmark results leak across test cases.
+    clear_row_json_cache()
 
 
 @pytest.fixture
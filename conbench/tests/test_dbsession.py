@@ -0,0 +1,25 @@
+from ..dbsession import current_read_session, current_session, read_session_is_replica
+
+
+def test_read_session_defaults_to_primary(application):
+    # No read replica configured.
+    assert not hasattr(application, "read_scoped_session")
+
+    with application.test_request_context():
+        assert current_read_session._get_current_object() is application.scoped_session
+        assert current_session._get_current_object() is application.scoped_session
+        assert not read_session_is_replica()
+
+
+def test_read_session_uses_replica_if_configured(application, monkeypatch):
+    # Stand-in for the scoped session set up for a read replica; routing does
+    # not need a second database.
+    replica_session = object()
+    monkeypatch.setattr(
+        application, "read_scoped_session", replica_session, raising=False
+    )
+
+    with application.test_request_context():
+        assert current_read_session._get_current_object() is replica_session
+        assert current_session._get_current_object() is application.scoped_session
+        assert read_session_is_replica()
@@ -0,0 +1,23 @@
+import math
+
+import pytest
+from flask.json.tag import TaggedJSONSerializer
+
+
+def test_json_provider_session_roundtrip(application):
+    # Flask's session cookie serializer passes `object_hook` to
+    # `app.json.loads()` for decoding tagged values (such as the tuples
+    # stored for flashed messages).
+    with application.app_context():
+        serializer = TaggedJSONSerializer()
+        session = {"_flashes": [("info", "hello")]}
+        assert serializer.loads(serializer.dumps(session)) == session
+
+
+def test_json_provider_stdlib_compat(application):
+    assert application.json.loads(b'{"a": [1, 2.5, "x"]}') == {"a": [1, 2.5, "x"]}
+    assert math.isnan(application.json.loads("NaN"))
+    assert application.json.loads("Infinity") == math.inf
+
+    with pytest.raises(ValueError):
+        application.json.loads(b'{"a": ')
@@ -0,0 +1,43 @@
+"""add run_id pagination index
+
+Replace the single-column run_id index by a composite (run_id, id) index. The
+latter serves all queries the former did (run_id is the leading column).
+
+Revision ID: 5e2b8c1f0a7d
+Revises: 74182bab6a9f
+Create Date: 2026-10-15 10:52:11.204518
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e2b8c1f0a7d"
+down_revision = "74182bab6a9f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "benchmark_result_run_id_id_idx",
+        "benchmark_result",
+        ["run_id", "id"],
+        unique=False,
+    )
+    op.drop_index(
+        "benchmark_result_run_id_index",
+        table_name="benchmark_result",
+    )
+
+
+def downgrade():
+    op.create_index(
+        "benchmark_result_run_id_index",
+        "benchmark_result",
+        ["run_id"],
+        unique=False,
+    )
+    op.drop_index(
+        "benchmark_result_run_id_id_idx",
+        table_name="benchmark_result",
+    )